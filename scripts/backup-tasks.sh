@@ -15,7 +15,7 @@ cp "$TASKS_FILE" "$BACKUP_DIR/tasks_backup_$TIMESTAMP.json"
 ls -t "$BACKUP_DIR"/tasks_backup_*.json | tail -n +11 | xargs rm -f 2>/dev/null
 
 # Optional: Commit to git if tasks.json has changes
-if ! git diff --quiet HEAD -- "$TASKS_FILE" 2>/dev/null; then
+if ! git --no-optional-locks diff --quiet HEAD -- "$TASKS_FILE" 2>/dev/null; then
     git add "$TASKS_FILE"
     git commit -m "chore: Auto-backup task progress - $(date)"
     echo "✅ Task progress committed to git"
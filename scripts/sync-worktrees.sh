@@ -5,8 +5,10 @@ MAIN_REPO="/Users/kuoloonchong/Desktop/akarii-test"
 
 echo "🔄 Syncing critical files to all worktrees..."
 
-# Get list of all worktrees except main
-git worktree list | grep -v "$MAIN_REPO" | awk '{print $1}' | while read worktree; do
+# Get list of all worktrees except main (porcelain output: one "worktree <path>" line each)
+git worktree list --porcelain | while read -r key worktree; do
+    [ "$key" = "worktree" ] && [ "$worktree" != "$MAIN_REPO" ] || continue
+
     echo ""
     echo "📁 Syncing to: $worktree"
     
@@ -7,9 +7,7 @@ MAIN_WORKTREE="/Users/kuoloonchong/Desktop/akarii-test"
 
 # Function to run task-master commands in main worktree
 run_task_command() {
-    cd "$MAIN_WORKTREE"
-    task-master "$@"
-    cd - > /dev/null
+    (cd "$MAIN_WORKTREE" && task-master "$@")
 }
 
 # Show usage
@@ -67,14 +67,15 @@ show_workflow_status() {
     echo "🔧 Current Workflow Mode: $mode"
     
     if [ "$mode" = "parallel-worktrees" ]; then
-        echo "📍 Current Directory: $(pwd)"
-        echo "🎯 Assigned Tasks: $(get_assigned_tasks)"
-        echo "🌿 Expected Branch: $(get_assigned_branch)"
-        echo "🌿 Current Branch: $(git branch --show-current 2>/dev/null || echo 'unknown')"
-        
+        # Resolve each value once and reuse it for both display and comparison
         local expected_branch=$(get_assigned_branch)
         local current_branch=$(git branch --show-current 2>/dev/null)
-        
+
+        echo "📍 Current Directory: $(pwd)"
+        echo "🎯 Assigned Tasks: $(get_assigned_tasks)"
+        echo "🌿 Expected Branch: $expected_branch"
+        echo "🌿 Current Branch: ${current_branch:-unknown}"
+
         if [ "$current_branch" != "$expected_branch" ]; then
             echo "⚠️  WARNING: You're on the wrong branch!"
             echo "   Run: git checkout $expected_branch"
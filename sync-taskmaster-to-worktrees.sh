@@ -13,10 +13,10 @@ fi
 # Get list of all worktrees
 echo "Syncing .taskmaster to all worktrees..."
 
-git worktree list | while read worktree_info; do
-    # Extract path (first column)
-    worktree_path=$(echo "$worktree_info" | awk '{print $1}')
-    
+git worktree list --porcelain | while read -r key worktree_path; do
+    # Porcelain output gives one "worktree <path>" line per worktree
+    [ "$key" = "worktree" ] || continue
+
     # Skip main repo
     if [ "$worktree_path" == "$MAIN_REPO" ]; then
         echo "Skipping main repo: $worktree_path"
@@ -25,15 +25,11 @@ git worktree list | while read worktree_info; do
     
     echo "Copying .taskmaster to: $worktree_path"
     
-    # Remove existing .taskmaster if it exists
-    if [ -d "$worktree_path/.taskmaster" ]; then
-        rm -rf "$worktree_path/.taskmaster"
-    fi
+    # Remove existing .taskmaster (no-op if it is missing)
+    rm -rf "$worktree_path/.taskmaster"
     
     # Copy .taskmaster directory
-    cp -r "$TASKMASTER_DIR" "$worktree_path/"
-    
-    if [ $? -eq 0 ]; then
+    if cp -r "$TASKMASTER_DIR" "$worktree_path/"; then
         echo "✅ Successfully synced to $worktree_path"
     else
         echo "❌ Failed to sync to $worktree_path"